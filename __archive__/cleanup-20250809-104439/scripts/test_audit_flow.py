@@ -7,26 +7,48 @@ without going through the entire end-to-end process.
 
 Usage:
     python scripts/test_audit_flow.py --audit-id YOUR_AUDIT_ID
+    python scripts/test_audit_flow.py --audit-id AUDIT_ID_1 AUDIT_ID_2 --test-flow
     python scripts/test_audit_flow.py --create-test-audit
+    python scripts/test_audit_flow.py --audit-id YOUR_AUDIT_ID --in-process
 """
 
 import asyncio
 import httpx
+import importlib.util
+import os
+import sys
 import uuid
 import argparse
-import json
+import orjson
 from typing import Optional
 
 # Configuration
 BASE_URL = "http://127.0.0.1:8000"
-AUDIT_API_BASE = f"{BASE_URL}/api/audits"
-ANALYSIS_API_BASE = f"{BASE_URL}/api/analysis"
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'backend')
+AUDIT_API_BASE = "/api/audits"
+ANALYSIS_API_BASE = "/api/analysis"
+# httpx only speaks HTTP/2 when the optional h2 package is installed (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 class AuditFlowTester:
     """Manual tester for audit status flow"""
     
-    def __init__(self):
-        self.client = httpx.AsyncClient()
+    def __init__(self, in_process: bool = False):
+        if in_process:
+            # Dispatch straight into the FastAPI app instead of going through a running server
+            # (startup/shutdown events are not run in this mode)
+            sys.path.insert(0, BACKEND_DIR)
+            from app.main import app
+            self.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test", timeout=10.0)
+        else:
+            # One pooled client for every call, so all requests reuse kept-alive connections to the backend;
+            # with h2 installed the concurrent per-audit flows are multiplexed when the server supports HTTP/2
+            self.client = httpx.AsyncClient(
+                base_url=BASE_URL,
+                http2=HTTP2_AVAILABLE,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+            )
     
     async def close(self):
         await self.client.aclose()
@@ -44,7 +66,7 @@ class AuditFlowTester:
             }
             
             brand_response = await self.client.post(
-                f"{BASE_URL}/api/brands/create",
+                "/api/brands/create",
                 json=brand_data
             )
             
@@ -52,7 +74,7 @@ class AuditFlowTester:
                 print(f"❌ Failed to create brand: {brand_response.text}")
                 return None
             
-            brand_result = brand_response.json()
+            brand_result = orjson.loads(brand_response.content)
             brand_id = brand_result.get("data", {}).get("brand_id")
             
             if not brand_id:
@@ -66,7 +88,7 @@ class AuditFlowTester:
             }
             
             product_response = await self.client.post(
-                f"{BASE_URL}/api/products/create",
+                "/api/products/create",
                 json=product_data
             )
             
@@ -74,7 +96,7 @@ class AuditFlowTester:
                 print(f"❌ Failed to create product: {product_response.text}")
                 return None
             
-            product_result = product_response.json()
+            product_result = orjson.loads(product_response.content)
             product_id = product_result.get("data", {}).get("product_id")
             
             if not product_id:
@@ -97,7 +119,7 @@ class AuditFlowTester:
                 print(f"❌ Failed to create audit: {audit_response.text}")
                 return None
             
-            audit_result = audit_response.json()
+            audit_result = orjson.loads(audit_response.content)
             audit_id = audit_result.get("data", {}).get("audit_id")
             
             if audit_id:
@@ -111,33 +133,38 @@ class AuditFlowTester:
             print(f"💥 Error creating test audit: {e}")
             return None
     
+    @staticmethod
+    def _log(audit_id: str, message: str = ""):
+        """Print one line tagged with its audit ID, so output from concurrent flows can be told apart"""
+        print(f"[{audit_id}] {message}".rstrip())
+    
     async def test_mark_setup_complete(self, audit_id: str) -> bool:
         """Test marking setup as complete"""
-        print(f"1️⃣ Testing mark-setup-complete for audit: {audit_id}")
+        self._log(audit_id, "1️⃣ Testing mark-setup-complete")
         
         try:
             response = await self.client.put(
                 f"{AUDIT_API_BASE}/{audit_id}/mark-setup-complete"
             )
             
-            print(f"   Status: {response.status_code}")
+            self._log(audit_id, f"   Status: {response.status_code}")
             
             if response.status_code == 200:
-                data = response.json()
-                print(f"   ✅ Success: {data.get('message', 'Unknown')}")
-                print(f"   📊 Status: {data.get('data', {}).get('status', 'unknown')}")
+                data = orjson.loads(response.content)
+                self._log(audit_id, f"   ✅ Success: {data.get('message', 'Unknown')}")
+                self._log(audit_id, f"   📊 Status: {data.get('data', {}).get('status', 'unknown')}")
                 return True
             else:
-                print(f"   ❌ Failed: {response.text}")
+                self._log(audit_id, f"   ❌ Failed: {response.text}")
                 return False
                 
         except Exception as e:
-            print(f"   💥 Error: {e}")
+            self._log(audit_id, f"   💥 Error: {e}")
             return False
     
     async def test_start_analysis(self, audit_id: str) -> Optional[str]:
         """Test starting analysis (requires queries to exist)"""
-        print(f"2️⃣ Testing analysis start for audit: {audit_id}")
+        self._log(audit_id, "2️⃣ Testing analysis start")
         
         try:
             response = await self.client.post(
@@ -145,45 +172,45 @@ class AuditFlowTester:
                 json={"audit_id": audit_id}
             )
             
-            print(f"   Status: {response.status_code}")
+            self._log(audit_id, f"   Status: {response.status_code}")
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 job_id = data.get("job_id")
-                print(f"   ✅ Success: {data.get('message', 'Unknown')}")
-                print(f"   📊 Job ID: {job_id}")
-                print(f"   📊 Total Queries: {data.get('total_queries', 0)}")
+                self._log(audit_id, f"   ✅ Success: {data.get('message', 'Unknown')}")
+                self._log(audit_id, f"   📊 Job ID: {job_id}")
+                self._log(audit_id, f"   📊 Total Queries: {data.get('total_queries', 0)}")
                 return job_id
             else:
-                print(f"   ❌ Failed: {response.text}")
+                self._log(audit_id, f"   ❌ Failed: {response.text}")
                 return None
                 
         except Exception as e:
-            print(f"   💥 Error: {e}")
+            self._log(audit_id, f"   💥 Error: {e}")
             return None
     
     async def test_complete_audit(self, audit_id: str) -> bool:
         """Test completing audit after analysis"""
-        print(f"3️⃣ Testing complete-audit for audit: {audit_id}")
+        self._log(audit_id, "3️⃣ Testing complete-audit")
         
         try:
             response = await self.client.put(
                 f"{AUDIT_API_BASE}/{audit_id}/complete"
             )
             
-            print(f"   Status: {response.status_code}")
+            self._log(audit_id, f"   Status: {response.status_code}")
             
             if response.status_code == 200:
-                data = response.json()
-                print(f"   ✅ Success: {data.get('message', 'Unknown')}")
-                print(f"   📊 Status: {data.get('data', {}).get('status', 'unknown')}")
+                data = orjson.loads(response.content)
+                self._log(audit_id, f"   ✅ Success: {data.get('message', 'Unknown')}")
+                self._log(audit_id, f"   📊 Status: {data.get('data', {}).get('status', 'unknown')}")
                 return True
             else:
-                print(f"   ❌ Failed: {response.text}")
+                self._log(audit_id, f"   ❌ Failed: {response.text}")
                 return False
                 
         except Exception as e:
-            print(f"   💥 Error: {e}")
+            self._log(audit_id, f"   💥 Error: {e}")
             return False
     
     async def get_audit_status(self, audit_id: str) -> Optional[dict]:
@@ -192,62 +219,71 @@ class AuditFlowTester:
             response = await self.client.get(f"{AUDIT_API_BASE}/{audit_id}")
             
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
-                print(f"❌ Failed to get audit status: {response.text}")
+                self._log(audit_id, f"❌ Failed to get audit status: {response.text}")
                 return None
                 
         except Exception as e:
-            print(f"💥 Error getting audit status: {e}")
+            self._log(audit_id, f"💥 Error getting audit status: {e}")
             return None
     
     async def test_complete_flow(self, audit_id: str):
         """Test the complete audit status flow"""
-        print(f"🧪 Testing complete audit flow for: {audit_id}")
-        print("=" * 60)
+        self._log(audit_id, "🧪 Testing complete audit flow")
+        self._log(audit_id, "=" * 60)
         
         # Step 1: Mark setup as complete
         setup_success = await self.test_mark_setup_complete(audit_id)
         if not setup_success:
-            print("❌ Setup completion failed, stopping test")
+            self._log(audit_id, "❌ Setup completion failed, stopping test")
             return
         
-        print()
+        self._log(audit_id)
         
         # Step 2: Start analysis (this will update status to analysis_running)
         job_id = await self.test_start_analysis(audit_id)
         if not job_id:
-            print("⚠️  Analysis start failed (this is expected if no queries exist)")
-            print("   You can still test the complete-audit endpoint manually")
+            self._log(audit_id, "⚠️  Analysis start failed (this is expected if no queries exist)")
+            self._log(audit_id, "   You can still test the complete-audit endpoint manually")
         
-        print()
+        self._log(audit_id)
         
         # Step 3: Check current status
-        print("📊 Checking current audit status...")
+        self._log(audit_id, "📊 Checking current audit status...")
         status_data = await self.get_audit_status(audit_id)
         if status_data:
             current_status = status_data.get("status", "unknown")
-            print(f"   Current status: {current_status}")
+            self._log(audit_id, f"   Current status: {current_status}")
         
-        print()
+        self._log(audit_id)
         
         # Step 4: Test complete audit (this would normally be called by backend)
-        print("💡 Note: The complete-audit endpoint is normally called by the backend")
-        print("   when analysis finishes. You can test it manually here:")
+        self._log(audit_id, "💡 Note: The complete-audit endpoint is normally called by the backend")
+        self._log(audit_id, "   when analysis finishes. You can test it manually here:")
         await self.test_complete_audit(audit_id)
         
-        print()
-        print("✅ Audit flow test completed!")
+        self._log(audit_id)
+        self._log(audit_id, "✅ Audit flow test completed!")
+    
+    async def test_individual_endpoints(self, audit_id: str):
+        """Hit each status endpoint once, in order, for one audit"""
+        await self.test_mark_setup_complete(audit_id)
+        self._log(audit_id)
+        await self.test_start_analysis(audit_id)
+        self._log(audit_id)
+        await self.test_complete_audit(audit_id)
 
 async def main():
     parser = argparse.ArgumentParser(description="Test audit status flow")
-    parser.add_argument("--audit-id", help="Audit ID to test with")
+    parser.add_argument("--audit-id", nargs="+", help="Audit ID(s) to test with")
     parser.add_argument("--create-test-audit", action="store_true", help="Create a test audit")
     parser.add_argument("--test-flow", action="store_true", help="Test the complete flow")
+    parser.add_argument("--in-process", action="store_true", help="Call the backend app in-process instead of a server on port 8000")
     
     args = parser.parse_args()
     
-    tester = AuditFlowTester()
+    tester = AuditFlowTester(in_process=args.in_process)
     
     try:
         if args.create_test_audit:
@@ -263,16 +299,14 @@ async def main():
             print("❌ Please provide an audit ID with --audit-id or use --create-test-audit")
             return
         
+        # Steps stay sequential within an audit (each depends on the previous status change),
+        # but separate audits are independent and run concurrently on the shared client
         if args.test_flow:
-            await tester.test_complete_flow(args.audit_id)
+            await asyncio.gather(*(tester.test_complete_flow(audit_id) for audit_id in args.audit_id))
         else:
             # Test individual endpoints
             print("🧪 Testing individual endpoints...")
-            await tester.test_mark_setup_complete(args.audit_id)
-            print()
-            await tester.test_start_analysis(args.audit_id)
-            print()
-            await tester.test_complete_audit(args.audit_id)
+            await asyncio.gather(*(tester.test_individual_endpoints(audit_id) for audit_id in args.audit_id))
     
     finally:
         await tester.close()
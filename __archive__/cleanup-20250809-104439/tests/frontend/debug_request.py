@@ -3,114 +3,181 @@
 Debug script to capture and analyze the frontend request
 """
 
-import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
-import json
-import threading
-import requests
-
-class DebugRequestHandler(BaseHTTPRequestHandler):
-    def do_POST(self):
-        if self.path == '/api/questions/generate':
-            # Read the request body
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            
-            print("🔍 INTERCEPTED FRONTEND REQUEST:")
-            print("="*60)
-            print(f"Path: {self.path}")
-            print(f"Headers: {dict(self.headers)}")
-            print(f"Body Length: {content_length}")
-            
-            try:
-                request_json = json.loads(post_data.decode('utf-8'))
-                print("📋 REQUEST JSON:")
-                print(json.dumps(request_json, indent=2))
-                
-                # Compare with working Postman request
-                print("\n🔍 ANALYSIS:")
-                print(f"Brand Name: {request_json.get('brandName', 'MISSING')}")
-                print(f"Product Name: {request_json.get('productName', 'MISSING')}")
-                print(f"Audit ID: {request_json.get('auditId', 'MISSING')}")
-                print(f"Topics Count: {len(request_json.get('topics', []))}")
-                print(f"Personas Count: {len(request_json.get('personas', []))}")
-                
-                if request_json.get('personas'):
-                    print("\n👥 PERSONAS:")
-                    for i, persona in enumerate(request_json['personas']):
-                        print(f"  {i+1}. {persona.get('name', 'NO_NAME')} (ID: {persona.get('id', 'NO_ID')})")
-                
-                if request_json.get('topics'):
-                    print("\n📚 TOPICS:")
-                    for i, topic in enumerate(request_json['topics']):
-                        print(f"  {i+1}. {topic.get('name', 'NO_NAME')} (ID: {topic.get('id', 'NO_ID')})")
-                
-                # Forward to real backend
-                print("\n📤 Forwarding to real backend...")
-                response = requests.post(
-                    "http://localhost:8000/api/questions/generate",
-                    json=request_json,
-                    headers={"Content-Type": "application/json"},
-                    timeout=60
-                )
-                
-                print(f"📋 Backend Response Status: {response.status_code}")
-                
-                if response.status_code == 200:
-                    response_data = response.json()
-                    print(f"✅ Success: {response_data.get('success')}")
-                    print(f"📊 Questions Count: {len(response_data.get('questions', []))}")
-                    print(f"📊 Source: {response_data.get('source')}")
-                    
-                    if response_data.get('source') == 'fallback':
-                        print(f"⚠️ FALLBACK REASON: {response_data.get('reason')}")
-                    
-                    # Return the response to frontend
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.send_header('Access-Control-Allow-Methods', 'POST, OPTIONS')
-                    self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-                    self.end_headers()
-                    self.wfile.write(response.content)
-                else:
-                    print(f"❌ Backend Error: {response.status_code}")
-                    print(f"Response: {response.text}")
-                    
-                    self.send_response(response.status_code)
-                    self.end_headers()
-                    self.wfile.write(response.content)
-                
-            except Exception as e:
-                print(f"❌ Error processing request: {e}")
-                self.send_response(500)
-                self.end_headers()
-                self.wfile.write(b'{"error": "Debug proxy error"}')
+import logging
+import os
+import re
+import sys
+import httpx
+import orjson
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
+
+BACKEND_URL = "http://localhost:8000"
+# Full request dumps (headers, indented JSON, every persona and topic) only with DEBUG_VERBOSE=1
+VERBOSE = os.environ.get("DEBUG_VERBOSE") == "1"
+
+# One stdout handler with bare messages; the verbose report is logged at DEBUG level
+logger = logging.getLogger("debug_proxy")
+logger.setLevel(logging.DEBUG if VERBOSE else logging.INFO)
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(_handler)
+logger.propagate = False
+
+app = FastAPI()
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["POST", "OPTIONS"],
+    allow_headers=["Content-Type"],
+)
+
+# One pooled client for every forwarded request, so the backend connection is kept alive
+CLIENT = httpx.AsyncClient(base_url=BACKEND_URL, limits=httpx.Limits(max_keepalive_connections=20))
+
+def format_request_report(path, headers, body_length, request_json):
+    """Build the full intercepted-request report as a single string"""
+    lines = [
+        "🔍 INTERCEPTED FRONTEND REQUEST:",
+        "="*60,
+        f"Path: {path}",
+        f"Headers: {dict(headers)}",
+        f"Body Length: {body_length}",
+        "📋 REQUEST JSON:",
+        orjson.dumps(request_json, option=orjson.OPT_INDENT_2).decode(),
+        # Compare with working Postman request
+        "\n🔍 ANALYSIS:",
+        f"Brand Name: {request_json.get('brandName', 'MISSING')}",
+        f"Product Name: {request_json.get('productName', 'MISSING')}",
+        f"Audit ID: {request_json.get('auditId', 'MISSING')}",
+        f"Topics Count: {len(request_json.get('topics', []))}",
+        f"Personas Count: {len(request_json.get('personas', []))}",
+    ]
+
+    if request_json.get('personas'):
+        lines.append("\n👥 PERSONAS:")
+        for i, persona in enumerate(request_json['personas']):
+            lines.append(f"  {i+1}. {persona.get('name', 'NO_NAME')} (ID: {persona.get('id', 'NO_ID')})")
+
+    if request_json.get('topics'):
+        lines.append("\n📚 TOPICS:")
+        for i, topic in enumerate(request_json['topics']):
+            lines.append(f"  {i+1}. {topic.get('name', 'NO_NAME')} (ID: {topic.get('id', 'NO_ID')})")
+
+    return "\n".join(lines)
+
+class ResponseSummary:
+    """Summarize a relayed backend response chunk by chunk, without keeping a successful body in memory"""
+
+    QUESTION_KEY = b'"personaId"'  # every question carries exactly one personaId
+    FIELD_RE = re.compile(rb'"(?P<key>success|source|reason)"\s*:\s*(?P<value>"(?:[^"\\]|\\.)*"|true|false|null)')
+    FIELD_TAIL = 1024  # bytes kept between chunks so a field split across them is still matched
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.question_count = 0
+        self.fields = {}
+        self.error_body = bytearray()  # only error responses are kept whole, for the error log
+        self._key_tail = b""
+        self._field_tail = b""
+
+    def feed(self, chunk):
+        if self.status_code != 200:
+            self.error_body.extend(chunk)
+            return
+
+        # The carried tail is shorter than the key, so no occurrence is counted twice
+        data = self._key_tail + chunk
+        self.question_count += data.count(self.QUESTION_KEY)
+        self._key_tail = data[-(len(self.QUESTION_KEY) - 1):]
+
+        data = self._field_tail + chunk
+        for match in self.FIELD_RE.finditer(data):
+            self.fields.setdefault(match.group('key').decode(), orjson.loads(match.group('value')))
+        self._field_tail = data[-self.FIELD_TAIL:]
+
+def log_backend_response(summary):
+    """Log the relayed backend response summary once it has been fully sent"""
+    if summary.status_code != 200:
+        logger.error("❌ Backend Error: %s", summary.status_code)
+        logger.error("Response: %s", summary.error_body.decode(errors='replace'))
+        return
+
+    if 'success' not in summary.fields:
+        logger.error("❌ Backend response has no 'success' field, it is probably not the expected JSON")
+        return
+
+    logger.info("✅ Success: %s", summary.fields.get('success'))
+    logger.info("📊 Questions Count: %d", summary.question_count)
+    logger.info("📊 Source: %s", summary.fields.get('source'))
+
+    if summary.fields.get('source') == 'fallback':
+        logger.warning("⚠️ FALLBACK REASON: %s", summary.fields.get('reason'))
+
+@app.post("/api/questions/generate")
+async def proxy_generate(request: Request):
+    post_data = await request.body()
+
+    try:
+        request_json = orjson.loads(post_data)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            # Build and write the full report only when DEBUG_VERBOSE asked for it
+            logger.debug(format_request_report(request.url.path, request.headers.items(), len(post_data), request_json))
         else:
-            self.send_response(404)
-            self.end_headers()
-    
-    def do_OPTIONS(self):
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
-    
-    def log_message(self, format, *args):
-        pass  # Suppress default logging
+            logger.info("🔍 INTERCEPTED FRONTEND REQUEST: %s (%d bytes)", request.url.path, len(post_data))
+
+        # Forward the original bytes to the real backend instead of re-serializing them
+        logger.info("\n📤 Forwarding to real backend...")
+        backend_request = CLIENT.build_request(
+            "POST",
+            "/api/questions/generate",
+            content=post_data,
+            headers={"Content-Type": "application/json"},
+            timeout=60
+        )
+        response = await CLIENT.send(backend_request, stream=True)
+
+        logger.info("📋 Backend Response Status: %s", response.status_code)
+
+        # Relay the body to the frontend chunk by chunk as it arrives, summarizing it on the way
+        summary = ResponseSummary(response.status_code)
+
+        async def relay():
+            try:
+                async for chunk in response.aiter_bytes():
+                    summary.feed(chunk)
+                    yield chunk
+            finally:
+                await response.aclose()
+
+        return StreamingResponse(
+            relay(),
+            status_code=response.status_code,
+            media_type=response.headers.get("content-type"),
+            background=BackgroundTask(log_backend_response, summary)
+        )
+
+    except Exception as e:
+        logger.error("❌ Error processing request: %s", e)
+        return Response(content=b'{"error": "Debug proxy error"}', status_code=500)
+
+@app.on_event("shutdown")
+async def close_client():
+    await CLIENT.aclose()
 
 def start_debug_proxy():
-    print("🔍 Starting debug proxy on http://localhost:8001")
-    print("📋 Configure frontend to use http://localhost:8001 instead of http://localhost:8000")
-    print("⏹️ Press Ctrl+C to stop")
-    
-    server = HTTPServer(('localhost', 8001), DebugRequestHandler)
-    try:
-        server.serve_forever()
-    except KeyboardInterrupt:
-        print("\n🛑 Debug proxy stopped")
-        server.shutdown()
+    logger.info("🔍 Starting debug proxy on http://localhost:8001")
+    logger.info("📋 Configure frontend to use http://localhost:8001 instead of http://localhost:8000")
+    logger.info("⏹️ Press Ctrl+C to stop")
+    if not VERBOSE:
+        logger.info("💡 Set DEBUG_VERBOSE=1 to dump full request details")
+
+    uvicorn.run(app, host="localhost", port=8001, log_level="warning")
+    logger.info("\n🛑 Debug proxy stopped")
 
 if __name__ == "__main__":
-    start_debug_proxy() 
\ No newline at end of file
+    start_debug_proxy()
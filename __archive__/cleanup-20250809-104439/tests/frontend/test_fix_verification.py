@@ -5,6 +5,7 @@ Test to verify the frontend fix is working correctly
 
 import requests
 import json
+from collections import defaultdict
 
 def test_frontend_fix_verification():
     """Test that the API response matches the fixed frontend types"""
@@ -87,23 +88,22 @@ def test_frontend_fix_verification():
             # Validate that all questions have required fields for frontend
             print("\n🔍 VALIDATING FRONTEND TYPE COMPATIBILITY:")
             
+            required_fields = ('id', 'text', 'personaId')
             valid_questions = 0
             invalid_questions = 0
+            shown = []
             
-            for i, question in enumerate(questions):
-                has_required_fields = (
-                    'id' in question and question['id'] and
-                    'text' in question and question['text'] and  
-                    'personaId' in question and question['personaId']
-                )
-                
-                if has_required_fields:
+            # Check each question once; show the first 3 if valid and every invalid one, then print in one batch
+            for i, q in enumerate(questions):
+                if all(q.get(field) for field in required_fields):
                     valid_questions += 1
-                    if i < 3:  # Show first 3 for verification
-                        print(f"  ✅ Question {i+1}: id='{question['id'][:8]}...', text='{question['text'][:40]}...', personaId='{question['personaId']}'")
+                    if i < 3:
+                        shown.append(f"  ✅ Question {i+1}: id='{q['id'][:8]}...', text='{q['text'][:40]}...', personaId='{q['personaId']}'")
                 else:
                     invalid_questions += 1
-                    print(f"  ❌ Question {i+1} MISSING REQUIRED FIELDS: {question}")
+                    shown.append(f"  ❌ Question {i+1} MISSING REQUIRED FIELDS: {q}")
+            if shown:
+                print("\n".join(shown))
             
             print(f"\n📊 VALIDATION RESULTS:")
             print(f"  Valid questions: {valid_questions}")
@@ -113,12 +113,14 @@ def test_frontend_fix_verification():
             print(f"\n🎯 SIMULATING FRONTEND FILTERING:")
             
             personas = test_data['personas']
-            questionsByPersona = {}
+            # Bucket questions by persona in one pass instead of rescanning per persona
+            buckets = defaultdict(list)
+            for q in questions:
+                buckets[q.get('personaId')].append(q)
+            questionsByPersona = {p['id']: buckets.get(p['id'], [])[:10] for p in personas}
             
             for persona in personas:
-                persona_questions = [q for q in questions if q.get('personaId') == persona['id']]
-                questionsByPersona[persona['id']] = persona_questions[:10]
-                
+                persona_questions = buckets.get(persona['id'], [])
                 print(f"  📋 {persona['name']} ({persona['id']}): {len(persona_questions)} questions")
                 if persona_questions:
                     print(f"    First: '{persona_questions[0]['text'][:50]}...'")
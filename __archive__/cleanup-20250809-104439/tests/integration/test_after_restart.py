@@ -3,19 +3,26 @@
 Test script to run after server restart
 """
 
+import orjson
 import requests
 import time
 
 def test_all_apis():
+    # One keep-alive connection for the whole workflow instead of a handshake per step
+    with requests.Session() as session:
+        session.headers.update({'Content-Type': 'application/json'})
+        _run_workflow(session)
+
+def _run_workflow(session):
     print("🧪 Testing all APIs after server restart...")
     print("="*60)
     
     # Test health check first
     print("\n1️⃣ Testing health check...")
     try:
-        response = requests.get('http://127.0.0.1:8000/api/questions/health', timeout=10)
+        response = session.get('http://127.0.0.1:8000/api/questions/health', timeout=10)
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"✅ Health: {result.get('status')}")
             print(f"✅ Services: {result.get('services')}")
         else:
@@ -34,10 +41,10 @@ def test_all_apis():
     }
     
     try:
-        response = requests.post('http://127.0.0.1:8000/api/topics/generate', 
-                               json=topics_data, timeout=30)
+        response = session.post('http://127.0.0.1:8000/api/topics/generate', 
+                              data=orjson.dumps(topics_data), timeout=30)
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"✅ Topics Source: {result.get('source')}")
             print(f"✅ Topics Count: {len(result.get('topics', []))}")
         else:
@@ -58,10 +65,10 @@ def test_all_apis():
     }
     
     try:
-        response = requests.post('http://127.0.0.1:8000/api/personas/generate',
-                               json=personas_data, timeout=30)
+        response = session.post('http://127.0.0.1:8000/api/personas/generate',
+                              data=orjson.dumps(personas_data), timeout=30)
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"✅ Personas Source: {result.get('source')}")
             print(f"✅ Personas Count: {len(result.get('personas', []))}")
         else:
@@ -97,10 +104,10 @@ def test_all_apis():
     }
     
     try:
-        response = requests.post('http://127.0.0.1:8000/api/questions/generate',
-                               json=questions_data, timeout=60)
+        response = session.post('http://127.0.0.1:8000/api/questions/generate',
+                              data=orjson.dumps(questions_data), timeout=60)
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"🎯 Questions Source: {result.get('source')}")
             print(f"🎯 Questions Count: {len(result.get('questions', []))}")
             print(f"🎯 Reason: {result.get('reason', 'N/A')}")
@@ -4,7 +4,41 @@ Test the enhanced backend with intelligent chunking and improved parsing
 """
 
 import requests
-import json
+import orjson
+
+def build_payload(persona_count: int, topic_count: int) -> dict:
+    """Build a question-generation payload with the given number of personas and topics"""
+    return {
+        "auditId": f"test-enhanced-{persona_count}-{topic_count}",
+        "brandName": "TestBrand Enhanced",
+        "brandDescription": "A test brand for enhanced backend testing",
+        "brandDomain": "testbrand.com",
+        "productName": "Test Product Enhanced",
+        "topics": [
+            {
+                "id": f"topic-{i}",
+                "name": f"Topic {i}",
+                "description": f"Description for topic {i}"
+            }
+            for i in range(1, topic_count + 1)
+        ],
+        "personas": [
+            {
+                "id": f"persona-{i}",
+                "name": f"Persona {i}",
+                "description": f"Description for persona {i}",
+                "painPoints": [f"Pain point {i}.1", f"Pain point {i}.2"],
+                "motivators": [f"Motivator {i}.1", f"Motivator {i}.2"],
+                "demographics": {
+                    "ageRange": "25-45",
+                    "gender": "Mixed",
+                    "location": "Urban",
+                    "goals": [f"Goal {i}.1", f"Goal {i}.2"]
+                }
+            }
+            for i in range(1, persona_count + 1)
+        ]
+    }
 
 def test_enhanced_backend():
     """Test the enhanced backend with various payload sizes"""
@@ -38,42 +72,18 @@ def test_enhanced_backend():
         }
     ]
     
+    # Build and serialize every payload once so the request loop only sends bytes
+    payloads = {
+        test_case["name"]: orjson.dumps(build_payload(test_case["personas"], test_case["topics"]))
+        for test_case in test_cases
+    }
+    session = requests.Session()
+    
     for test_case in test_cases:
         print(f"\n🧪 {test_case['name']}")
         print("="*60)
         
-        # Generate test payload
-        payload = {
-            "auditId": f"test-enhanced-{test_case['personas']}-{test_case['topics']}",
-            "brandName": "TestBrand Enhanced",
-            "brandDescription": "A test brand for enhanced backend testing",
-            "brandDomain": "testbrand.com",
-            "productName": "Test Product Enhanced",
-            "topics": [
-                {
-                    "id": f"topic-{i}",
-                    "name": f"Topic {i}",
-                    "description": f"Description for topic {i}"
-                }
-                for i in range(1, test_case["topics"] + 1)
-            ],
-            "personas": [
-                {
-                    "id": f"persona-{i}",
-                    "name": f"Persona {i}",
-                    "description": f"Description for persona {i}",
-                    "painPoints": [f"Pain point {i}.1", f"Pain point {i}.2"],
-                    "motivators": [f"Motivator {i}.1", f"Motivator {i}.2"],
-                    "demographics": {
-                        "ageRange": "25-45",
-                        "gender": "Mixed",
-                        "location": "Urban",
-                        "goals": [f"Goal {i}.1", f"Goal {i}.2"]
-                    }
-                }
-                for i in range(1, test_case["personas"] + 1)
-            ]
-        }
+        payload_bytes = payloads[test_case["name"]]
         
         expected_questions = test_case["personas"] * 10
         print(f"📊 Payload: {test_case['personas']} personas, {test_case['topics']} topics")
@@ -81,9 +91,9 @@ def test_enhanced_backend():
         print(f"📊 Expected strategy: {test_case['expected_strategy']}")
         
         try:
-            response = requests.post(
+            response = session.post(
                 "http://localhost:8000/api/questions/generate",
-                json=payload,
+                data=payload_bytes,
                 headers={"Content-Type": "application/json"},
                 timeout=120  # Longer timeout for chunked requests
             )
@@ -149,6 +159,7 @@ def test_enhanced_backend():
         except Exception as e:
             print(f"❌ Exception: {e}")
     
+    session.close()
     print(f"\n🎯 Enhanced Backend Testing Complete!")
     print("="*60)
 
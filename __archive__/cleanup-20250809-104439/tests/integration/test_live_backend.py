@@ -3,10 +3,53 @@
 Test Live Backend - Debug the exact parsing issue
 """
 
-import requests
-import json
+import argparse
+import asyncio
+import hashlib
+import os
+import time
+import httpx
+import orjson
 
-def test_backend_with_debug():
+# Local replay cache for generate responses, keyed by the request payload
+CACHE_DIR = ".llm_cache"
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+def cache_path(json_body, cache_dir=CACHE_DIR):
+    """Cache file for a payload, keyed by the SHA-256 of its key-sorted JSON"""
+    key = hashlib.sha256(orjson.dumps(json_body, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    return os.path.join(cache_dir, f"{key}.json")
+
+def read_cached(path):
+    """Return the cached response body, or None if missing or older than the TTL"""
+    try:
+        if time.time() - os.path.getmtime(path) < CACHE_TTL_SECONDS:
+            with open(path, 'rb') as f:
+                return f.read()
+    except OSError:
+        pass
+    return None
+
+def pop_sse_events(pending):
+    """Remove every complete Server-Sent Event from the buffer, returning (event, data) pairs"""
+    events = []
+    while (end := pending.find(b"\n\n")) != -1:
+        event, data = "message", b"null"
+        for line in bytes(pending[:end]).split(b"\n"):
+            if line.startswith(b"event: "):
+                event = line[7:].decode()
+            elif line.startswith(b"data: "):
+                data = line[6:]
+        del pending[:end + 2]
+        events.append((event, orjson.loads(data)))
+    return events
+
+def write_cached(path, body):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(body)
+
+async def test_backend_with_debug(use_cache=True):
     print("🧪 Testing Live Backend Question Generation...")
     
     # Use the same test data as our test_api.json
@@ -58,43 +101,75 @@ def test_backend_with_debug():
         ]
     }
     
+    # The stream endpoint sends each question as its own SSE event, so render as they arrive
+    pending = bytearray()
+    shown = 0
+    summary = None
+    
+    def show_events(chunk):
+        nonlocal shown, summary
+        pending.extend(chunk)
+        for event, data in pop_sse_events(pending):
+            if event == "message":
+                shown += 1
+                if shown <= 3:
+                    print(f"  {shown}. {data.get('text', 'No text')}")
+                    print(f"     Persona: {data.get('personaId', 'No persona')}")
+                    print(f"     Topic: {data.get('topicName', 'No topic')}")
+                    print()
+            elif event == "done":
+                summary = data
+            elif event == "error":
+                print(f"❌ Stream error: {data.get('detail')}")
+    
+    cache_file = cache_path(test_data)
+    body = read_cached(cache_file) if use_cache else None
+    
     try:
-        print("📤 Making request to backend...")
-        response = requests.post(
-            'http://127.0.0.1:8000/api/questions/generate',
-            headers={'Content-Type': 'application/json'},
-            json=test_data,
-            timeout=60
-        )
-        
-        print(f"📋 Response Status: {response.status_code}")
-        print(f"📋 Response Headers: {dict(response.headers)}")
-        
-        if response.status_code == 200:
-            result = response.json()
-            print(f"✅ Success: {result.get('success')}")
-            print(f"📊 Source: {result.get('source')}")
-            print(f"📊 Questions Count: {len(result.get('questions', []))}")
-            print(f"⏱️ Processing Time: {result.get('processingTime')}ms")
-            
-            if result.get('reason'):
-                print(f"ℹ️ Reason: {result.get('reason')}")
-                
-            # Show first few questions
-            questions = result.get('questions', [])
+        if body is not None:
+            print(f"💾 Replaying cached response from {cache_file}")
             print(f"\n📝 First 3 Questions:")
-            for i, q in enumerate(questions[:3]):
-                print(f"  {i+1}. {q.get('text', 'No text')}")
-                print(f"     Persona: {q.get('personaId', 'No persona')}")
-                print(f"     Topic: {q.get('topicName', 'No topic')}")
-                print()
-                
+            show_events(body)
         else:
-            print(f"❌ Error: {response.status_code}")
-            print(f"❌ Response: {response.text}")
+            print("📤 Making request to backend...")
+            async with httpx.AsyncClient(base_url='http://127.0.0.1:8000', timeout=60) as client:
+                async with client.stream(
+                    'POST', '/api/questions/generate/stream',
+                    content=orjson.dumps(test_data),
+                    headers={'Content-Type': 'application/json'},
+                ) as response:
+                    print(f"📋 Response Status: {response.status_code}")
+                    print(f"📋 Response Headers: {dict(response.headers)}")
+                    
+                    if response.status_code != 200:
+                        await response.aread()
+                        print(f"❌ Error: {response.status_code}")
+                        print(f"❌ Response: {response.text}")
+                        return
+                    
+                    body = bytearray()
+                    print(f"\n📝 First 3 Questions:")
+                    async for chunk in response.aiter_bytes():
+                        body += chunk
+                        show_events(chunk)
+            
+            # Only cache complete generations, not streams that ended in an error event
+            if use_cache and summary is not None:
+                write_cached(cache_file, body)
+        
+        if summary is None:
+            print("❌ Stream ended without a summary event")
+            return
+        print(f"✅ Success: {summary.get('success')}")
+        print(f"📊 Source: {summary.get('source')}")
+        print(f"📊 Questions Count: {summary.get('questionCount', shown)}")
+        print(f"⏱️ Processing Time: {summary.get('processingTime')}ms")
             
     except Exception as e:
         print(f"💥 Exception: {e}")
 
 if __name__ == "__main__":
-    test_backend_with_debug() 
\ No newline at end of file
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--no-cache", action="store_true", help="always call the backend and skip the response cache")
+    args = arg_parser.parse_args()
+    asyncio.run(test_backend_with_debug(use_cache=not args.no_cache))
@@ -3,10 +3,12 @@
 Test to verify persona ID handling between frontend and backend
 """
 
-import requests
-import json
+import asyncio
+from collections import Counter
+import httpx
+import orjson
 
-def test_persona_id_mismatch():
+async def test_persona_id_mismatch():
     """Test the actual persona ID values being sent and returned"""
     
     print("🔍 Testing Persona ID Mismatch...")
@@ -47,26 +49,26 @@ def test_persona_id_mismatch():
         print(f"  - {persona['name']}: {persona['id']}")
     
     try:
-        response = requests.post(
-            "http://localhost:8000/api/questions/generate",
-            json=test_data,
-            headers={"Content-Type": "application/json"},
-            timeout=30
-        )
+        async with httpx.AsyncClient(base_url="http://localhost:8000", timeout=30) as client:
+            response = await client.post(
+                "/api/questions/generate",
+                content=orjson.dumps(test_data),
+                headers={"Content-Type": "application/json"},
+            )
         
         print(f"\n📋 Response Status: {response.status_code}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Success: {data['success']}")
             print(f"📊 Questions Count: {len(data['questions'])}")
             print(f"📊 Source: {data['source']}")
             
             print("\n📥 Received questions with persona IDs:")
-            persona_id_counts = {}
+            persona_id_counts = Counter()
             for i, question in enumerate(data['questions'][:5]):  # Show first 5
                 persona_id = question.get('personaId')
-                persona_id_counts[persona_id] = persona_id_counts.get(persona_id, 0) + 1
+                persona_id_counts[persona_id] += 1
                 print(f"  Question {i+1}: personaId='{persona_id}' | text='{question['text'][:50]}...'")
             
             print(f"\n📊 Persona ID distribution:")
@@ -99,4 +101,4 @@ def test_persona_id_mismatch():
         print(f"❌ Exception: {e}")
 
 if __name__ == "__main__":
-    test_persona_id_mismatch() 
\ No newline at end of file
+    asyncio.run(test_persona_id_mismatch()) 
\ No newline at end of file
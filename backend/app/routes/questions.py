@@ -11,6 +11,7 @@ SECURITY BENEFITS:
 
 ENDPOINTS:
 - POST /generate - Generate questions using GroqCloud AI
+- POST /generate/stream - Stream generated questions as Server-Sent Events
 - POST /store - Store generated questions in database
 - GET /by-audit/{audit_id} - Get questions for a specific audit
 - POST /retry-failed-personas - Retry question generation for failed personas
@@ -19,18 +20,22 @@ ARCHITECTURE:
 Frontend → FastAPI Backend → GroqCloud → Backend → Frontend
 """
 
+import functools
+import io
 import time
-import json
 import httpx
 import asyncio
 import uuid
 import os
+import re
 import sys
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
 from datetime import datetime, timedelta
 
+import ijson
+import orjson
 from fastapi import APIRouter, HTTPException, Depends, Request, Path
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, validator
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
@@ -45,6 +50,7 @@ from ..models.questions import (
     QuestionsStoreRequest, QuestionsStoreResponse, QuestionsRetrieveResponse,
     QuestionUpdateRequest, QuestionUpdateResponse
 )
+from ..services.question_stream import IncrementalQuestionParser
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -62,6 +68,33 @@ class GroqConfig:
     TEMPERATURE = settings.GROQ_TEMPERATURE
     TIMEOUT = settings.GROQ_TIMEOUT
 
+# Outermost JSON span of a GroqCloud response: skips chatty prefixes and code fences
+# before the first { or [ and ends at the last } or ], all in a single scan
+_JSON_ENVELOPE_RE = re.compile(r'[^{\[]*(?P<body>[\{\[].*[\}\]])', re.DOTALL)
+
+# GroqCloud field-name repairs, applied in a single scan:
+#   "text": "...", "SomePersonaName", "topicName": -> "text": "...", "personaId": "SomePersonaName", "topicName":
+#   "personaId"|"topicName": "...", "SomeValue" } -> ..., "queryType": "SomeValue" }
+# topicName is only looked ahead at so a following missing queryType is still repaired
+_GROQ_FIELD_FIX_RE = re.compile(
+    r'(?P<text>"text":\s*"[^"]*"),\s*"(?P<persona_id>[^"]*)",\s*(?="topicName":)'
+    r'|(?P<field>"(?:personaId|topicName)":\s*"[^"]*"),\s*"(?P<query_type>[^"]*)"(?P<close>\s*})'
+)
+# Last-resort positional decoding of a single malformed question object: its string
+# literals, each either a bare value or a key with its value (None unless a string)
+_QUESTION_TOKEN_RE = re.compile(
+    r'"(?P<literal>(?:[^"\\]|\\.)*)"(?P<keyed>\s*:\s*(?:"(?P<value>(?:[^"\\]|\\.)*)"|[^",}]*))?'
+)
+_JSON_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"')
+_QUESTION_FIELDS = ("text", "personaId", "topicName", "queryType")
+_QUESTION_CONTAINER_CHARS = frozenset('{}[]')
+# Object payloads only get per-object salvage when they follow the {"questions": [...]} schema
+_QUESTIONS_OBJECT_RE = re.compile(r'\{\s*"questions"\s*:\s*\[')
+# Complete question objects salvaged from truncated responses
+_PARTIAL_QUESTION_RE = re.compile(
+    r'\{\s*"text":\s*"([^"]+)"\s*,\s*"personaId":\s*"([^"]+)"\s*(?:,\s*"topicName":\s*"([^"]*)")?\s*(?:,\s*"queryType":\s*"([^"]*)")?\s*\}'
+)
+
 def get_groq_api_key() -> Optional[str]:
     """Get GroqCloud API key from environment variables"""
     api_key = settings.GROQ_API_KEY
@@ -170,19 +203,194 @@ Generate the {len(personas)*10} questions now.
     return prompt
     return prompt
 
+def create_groq_payload(prompt: str, persona_count: int, stream: bool = False) -> Dict[str, Any]:
+    """Build the GroqCloud chat completion payload asking for 10 questions per persona"""
+    payload = {
+        "model": GroqConfig.MODEL,
+        "messages": [
+            {
+                "role": "system",
+                "content": f"You are an expert consumer research analyst. Generate exactly {persona_count * 10} specific, actionable questions for brand analysis - exactly 10 questions per persona. Always respond with ONLY a valid JSON array in this format: [{{\"text\": \"question\", \"personaId\": \"exact_id\", \"topicName\": \"topic\", \"queryType\": \"brand_analysis\"}}, ...]"
+            },
+            {
+                "role": "user", 
+                "content": prompt
+            }
+        ],
+        "max_tokens": GroqConfig.MAX_TOKENS,
+        "temperature": GroqConfig.TEMPERATURE
+    }
+    if stream:
+        payload["stream"] = True
+    return payload
+
+@functools.lru_cache(maxsize=128)
+def _persona_maps(persona_keys: Tuple[Tuple[Optional[str], Optional[str]], ...]) -> Tuple[frozenset, Dict[str, str]]:
+    """Build the valid persona ID set and name to ID mapping for (id, name) pairs
+
+    The returned dict is shared between cached calls and must not be mutated.
+    """
+    valid_persona_ids = frozenset(persona_id for persona_id, _ in persona_keys if persona_id)
+    persona_name_to_id = {name: persona_id for persona_id, name in persona_keys if persona_id and name}
+    return valid_persona_ids, persona_name_to_id
+
+def _build_questions(questions_iter, valid_persona_ids, persona_name_to_id: Dict[str, str]) -> List[Question]:
+    """Validate raw question dicts from the AI response and convert them to Question models"""
+    validated = []
+    # Resolve the fallback persona once instead of copying the ID set per question
+    fallback_persona_id = next(iter(valid_persona_ids), None)
+    for i, q_data in enumerate(questions_iter):
+        # 🔧 MORE FLEXIBLE QUESTION PARSING
+        if not isinstance(q_data, dict):
+            logger.warning("⚠️ Skipping question %d - not a dict: %s", i + 1, q_data)
+            continue
+            
+        if "text" not in q_data:
+            logger.warning("⚠️ Skipping question %d without text: %s", i + 1, q_data)
+            continue
+        
+        # Handle missing or malformed personaId
+        persona_id = q_data.get("personaId", "")
+        if not persona_id:
+            logger.warning("⚠️ Question %d missing personaId, using first available", i + 1)
+            persona_id = fallback_persona_id or str(uuid.uuid4())
+        
+        # 🔧 HANDLE BOTH PERSONA IDS AND NAMES
+        if persona_id not in valid_persona_ids:
+            # Try to map persona name to ID
+            if persona_id in persona_name_to_id:
+                original_persona_id = persona_id
+                persona_id = persona_name_to_id[persona_id]
+                logger.debug("🔄 Mapped persona name '%s' to ID '%s'", original_persona_id, persona_id)
+            else:
+                logger.warning("⚠️ Invalid persona ID '%s', using first available", persona_id)
+                persona_id = fallback_persona_id or str(uuid.uuid4())
+        
+        validated.append((q_data, persona_id))
+        logger.debug("✅ Successfully validated question %d for persona %s", i + 1, persona_id)
+    
+    # Generate all question IDs from one urandom read once the valid count is known
+    random_bytes = os.urandom(16 * len(validated))
+    question_ids = [
+        str(uuid.UUID(bytes=random_bytes[offset:offset + 16], version=4))
+        for offset in range(0, len(random_bytes), 16)
+    ]
+    return [
+        Question(
+            id=question_id,
+            text=q_data["text"],
+            personaId=persona_id,
+            auditId="", # Will be set when storing
+            topicName=q_data.get("topicName", "General"),
+            queryType=q_data.get("queryType", "brand_analysis")
+        )
+        for question_id, (q_data, persona_id) in zip(question_ids, validated)
+    ]
+
+def _fix_groq_field(match: re.Match) -> str:
+    if match.group('persona_id') is not None:
+        return f'{match.group("text")}, "personaId": "{match.group("persona_id")}", '
+    return f'{match.group("field")}, "queryType": "{match.group("query_type")}"{match.group("close")}'
+
+def _repair_groq_object_json(response_text: str) -> str:
+    """Restore field names GroqCloud sometimes drops from question objects"""
+    return _GROQ_FIELD_FIX_RE.sub(_fix_groq_field, response_text)
+
+def _repair_question_object(raw_object: bytes) -> Optional[Dict[str, str]]:
+    """Recover one malformed question object: field-name repair first, positional decoding last"""
+    object_text = raw_object.decode(errors='replace')
+    try:
+        question = orjson.loads(_repair_groq_object_json(object_text))
+    except orjson.JSONDecodeError:
+        return _decode_positional_question(object_text)
+    return question if isinstance(question, dict) else None
+
+def _decode_positional_question(object_text: str) -> Optional[Dict[str, str]]:
+    """Decode one question object against the fixed text/personaId/topicName/queryType schema
+
+    GroqCloud sometimes drops field names but keeps values in schema order, e.g.
+    {"text": "...", "Persona Name", "topicName": "...", "comparison"}. The text must be
+    keyed; other keyed string values are taken as-is, a bare value closing the object once
+    personaId is known is the queryType, and any other bare value fills the first missing
+    field. Objects without a keyed text, or with nested containers, are not questions.
+    """
+    object_body = object_text[1:-1]
+    if not _QUESTION_CONTAINER_CHARS.isdisjoint(_JSON_STRING_RE.sub('""', object_body)):
+        return None
+    
+    # (key, value) pairs, with an empty key for bare values and no value for non-string ones
+    tokens = [
+        (match.group('literal'), match.group('value')) if match.group('keyed') is not None
+        else ("", match.group('literal'))
+        for match in _QUESTION_TOKEN_RE.finditer(object_body)
+    ]
+    question = {}
+    for key, value in tokens:
+        if key in _QUESTION_FIELDS and value is not None:
+            question.setdefault(key, value)
+    if "text" not in question:
+        return None
+    for position, (key, value) in enumerate(tokens):
+        if key:
+            continue
+        if position == len(tokens) - 1 and "personaId" in question and "queryType" not in question:
+            field = "queryType"
+        else:
+            field = next((name for name in _QUESTION_FIELDS if name not in question), None)
+        if field is None:
+            break
+        question[field] = value
+    return {field: _unescape_json_string(value) for field, value in question.items()}
+
+def _salvage_question_objects(response_text: str) -> List[Dict]:
+    """Recover question objects one by one from a malformed {"questions": [...]} payload
+
+    The string-aware incremental scanner splits the payload into top-level question
+    objects, so braces inside question text never cut an object short; each object that
+    does not parse is run through _repair_question_object and dropped if that fails too.
+    Objects without a string text are dropped here so one of them cannot fail the batch.
+    An unbalanced payload means some object swallowed its neighbours, so nothing is
+    salvaged and partial parsing gets the whole text instead.
+    """
+    parser = IncrementalQuestionParser(item_depth=2, repair=_repair_question_object)
+    questions = parser.feed(response_text.encode())
+    if parser.depth != 0 or parser.in_string:
+        logger.warning("⚠️ Unbalanced question objects in malformed response, skipping salvage")
+        return []
+    return [question for question in questions if isinstance(question.get("text"), str)]
+
+def _unescape_json_string(value: str) -> str:
+    """Decode JSON escapes in a raw string literal body, keeping it as-is if they are invalid"""
+    # Only values carrying escapes need a real JSON string decode
+    if '\\' not in value:
+        return value
+    try:
+        return orjson.loads(f'"{value}"')
+    except orjson.JSONDecodeError:
+        return value
+
+def _stream_questions(
+    response_text: str,
+    json_type: str,
+    valid_persona_ids,
+    persona_name_to_id: Dict[str, str]
+) -> List[Question]:
+    """Stream question dicts out of a JSON object ({"questions": [...]}) or array payload"""
+    items_prefix = 'questions.item' if json_type == 'object' else 'item'
+    return _build_questions(
+        ijson.items(io.BytesIO(response_text.encode()), items_prefix),
+        valid_persona_ids,
+        persona_name_to_id
+    )
+
 def parse_questions_from_response(response_text: str, personas: List[Dict]) -> Optional[List[Question]]:
     """Parse questions from GroqCloud response - Enhanced for large responses"""
     
     try:
-        # Create a mapping of persona IDs for validation
-        valid_persona_ids = {persona.get('id') for persona in personas if persona.get('id')}
-        logger.info(f"Valid persona IDs: {valid_persona_ids}")
-        
-        # 🔧 CREATE PERSONA NAME TO ID MAPPING
-        persona_name_to_id = {}
-        for persona in personas:
-            if persona.get('id') and persona.get('name'):
-                persona_name_to_id[persona['name']] = persona['id']
+        # 🔧 PERSONA ID SET AND NAME TO ID MAPPING (cached across calls for the same personas)
+        persona_keys = tuple((persona.get('id'), persona.get('name')) for persona in personas)
+        valid_persona_ids, persona_name_to_id = _persona_maps(persona_keys)
+        logger.info(f"Valid persona IDs: {set(valid_persona_ids)}")
         logger.info(f"Persona name to ID mapping: {persona_name_to_id}")
         
         # 🐛 ADD DETAILED LOGGING FOR RESPONSE CONTENT
@@ -194,214 +402,104 @@ def parse_questions_from_response(response_text: str, personas: List[Dict]) -> O
         response_text = response_text.strip()
         original_response = response_text
         
-        # 🔧 ENHANCED RESPONSE CLEANING FOR GROQCLOUD FORMAT
-        # Remove common prefixes that GroqCloud includes
-        prefixes_to_remove = [
-            "Here are the generated customer questions",
-            "Here are the questions", 
-            "Here are the 10 consumer perception research questions",
-            "Here are 10 consumer perception research questions",
-            "Here are the consumer perception research questions",
-            "Here is the JSON",
-            "```json",
-            "```",
-            "**",
-            "JSON:"
-        ]
-        
-        for prefix in prefixes_to_remove:
-            if response_text.lower().startswith(prefix.lower()):
-                logger.info(f"🔧 Removing prefix: '{prefix}'")
-                response_text = response_text[len(prefix):].strip()
-        
-        # 🔧 HANDLE BOTH OBJECT AND ARRAY FORMATS
-        # Look for both { (object) and [ (array) as JSON start
-        json_start_obj = response_text.find('{')
-        json_start_arr = response_text.find('[')
+        # 🚀 FAST PATH: clean JSON parses in one native call, skipping envelope extraction and repair
+        try:
+            parsed_json = orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            parsed_json = None
+        if isinstance(parsed_json, dict):
+            parsed_json = parsed_json.get("questions")
+        if isinstance(parsed_json, list):
+            questions = _build_questions(parsed_json, valid_persona_ids, persona_name_to_id)
+            if questions:
+                logger.info(f"✅ Successfully parsed {len(questions)} questions from clean AI response")
+                return questions
         
-        # Use whichever comes first (or only one if the other is -1)
-        if json_start_obj != -1 and json_start_arr != -1:
-            json_start = min(json_start_obj, json_start_arr)
-            json_type = 'object' if json_start == json_start_obj else 'array'
-        elif json_start_obj != -1:
-            json_start = json_start_obj
-            json_type = 'object'
-        elif json_start_arr != -1:
-            json_start = json_start_arr
-            json_type = 'array'
-        else:
+        # 🔧 ENHANCED RESPONSE CLEANING FOR GROQCLOUD FORMAT
+        # One scan skips chatty prefixes and code fences up to the first { (object) or [ (array)
+        # and captures through the last } or ], dropping any trailing text or closing fence
+        envelope = _JSON_ENVELOPE_RE.match(response_text)
+        if not envelope:
             logger.error("❌ No JSON found in response")
             return None
+        json_start = envelope.start('body')
+        json_type = 'object' if response_text[json_start] == '{' else 'array'
+        close_char = '}' if json_type == 'object' else ']'
         
         if json_start > 0:
             logger.info(f"🔧 Found JSON {json_type} start at position {json_start}, removing prefix text")
-            response_text = response_text[json_start:]
+        # Trailing text after the last bracket, or a payload that stops on the wrong bracket, means truncation
+        is_truncated = envelope.end('body') < len(response_text) or not envelope.group('body').endswith(close_char)
+        response_text = envelope.group('body')
         
         # 🆕 ENHANCED: Handle truncated responses by trying to repair them
-        if json_type == 'object':
-            # For objects, ensure we have a closing brace
-            if not response_text.strip().endswith('}'):
-                logger.warning("⚠️ Response appears truncated (missing closing }), attempting to repair...")
-                # Find the last complete question entry
-                last_complete_entry = response_text.rfind('"}')
-                if last_complete_entry != -1:
-                    # Truncate to the last complete entry and close the JSON
-                    response_text = response_text[:last_complete_entry + 2]
-                    if not response_text.strip().endswith(']}'):
-                        response_text += ']}'
-                    else:
-                        response_text += '}'
-                    logger.info(f"🔧 Repaired truncated object response")
-        else:  # array
-            # For arrays, ensure we have a closing bracket
-            if not response_text.strip().endswith(']'):
-                logger.warning("⚠️ Response appears truncated (missing closing ]), attempting to repair...")
-                # Find the last complete question entry
-                last_complete_entry = response_text.rfind('}')
-                if last_complete_entry != -1:
-                    # Truncate to the last complete entry and close the array
-                    response_text = response_text[:last_complete_entry + 1] + ']'
-                    logger.info(f"🔧 Repaired truncated array response")
+        if is_truncated and json_type == 'object':
+            logger.warning("⚠️ Response appears truncated (missing closing }), attempting to repair...")
+            # Find the last complete question entry
+            last_complete_entry = response_text.rfind('"}')
+            if last_complete_entry != -1:
+                # Truncate to the last complete entry and close the JSON
+                response_text = response_text[:last_complete_entry + 2] + ']}'
+                logger.info(f"🔧 Repaired truncated object response")
+        elif is_truncated:  # array
+            logger.warning("⚠️ Response appears truncated (missing closing ]), attempting to repair...")
+            # Find the last complete question entry
+            last_complete_entry = response_text.rfind('}')
+            if last_complete_entry != -1:
+                # Truncate to the last complete entry and close the array
+                response_text = response_text[:last_complete_entry + 1] + ']'
+                logger.info(f"🔧 Repaired truncated array response")
         
-        # Remove everything after the last } or ] character depending on type
-        if json_type == 'object':
-            json_end = response_text.rfind('}')
-            if json_end > 0 and json_end < len(response_text) - 1:
-                logger.info(f"🔧 Found JSON object end at position {json_end}, removing suffix text")
-                response_text = response_text[:json_end + 1]
-        else:  # array
-            json_end = response_text.rfind(']')
-            if json_end > 0 and json_end < len(response_text) - 1:
-                logger.info(f"🔧 Found JSON array end at position {json_end}, removing suffix text")
-                response_text = response_text[:json_end + 1]
-        
-        # Handle markdown code blocks
-        if response_text.startswith("```json"):
-            logger.info("🔧 Removing ```json prefix")
-            response_text = response_text[7:]
-        if response_text.endswith("```"):
-            logger.info("🔧 Removing ``` suffix")
-            response_text = response_text[:-3]
-        
-        response_text = response_text.strip()
+        # 🚀 STREAM-PARSE WELL-FORMED RESPONSES
+        # ijson yields one question dict at a time, so large chunked responses never
+        # materialize the full parsed tree; only malformed JSON falls through to repair
+        try:
+            questions = _stream_questions(response_text, json_type, valid_persona_ids, persona_name_to_id)
+            if questions:
+                logger.info(f"✅ Successfully stream-parsed {len(questions)} questions from AI response")
+                return questions
+            logger.info("🔧 Streaming parse found no questions, falling back to JSON repair")
+        except ijson.JSONError as e:
+            logger.warning(f"⚠️ Streaming parse failed ({e}), falling back to JSON repair")
         
-        # 🔧 FIX GROQCLOUD JSON FORMATTING ISSUES (only for malformed objects)
+        questions = None
         if json_type == 'object':
+            # 🔧 FIX GROQCLOUD JSON FORMATTING ISSUES (only for malformed objects)
             logger.info("🔧 Attempting to fix GroqCloud JSON formatting issues...")
+            response_text = _repair_groq_object_json(response_text)
             
-            # Fix missing personaId field names
-            import re
-            
-            # Pattern: "text": "...", "SomePersonaName", -> "text": "...", "personaId": "SomePersonaName",
-            response_text = re.sub(
-                r'("text":\s*"[^"]*"),\s*"([^"]*)",\s*("topicName":)',
-                r'\1, "personaId": "\2", \3',
-                response_text
-            )
-            
-            # Pattern: "personaId": "...", "SomeValue" -> "personaId": "...", "queryType": "SomeValue"
-            response_text = re.sub(
-                r'("personaId":\s*"[^"]*"),\s*"([^"]*)"(\s*})',
-                r'\1, "queryType": "\2"\3',
-                response_text
-            )
-            
-            # Pattern: "topicName": "...", "some_value" -> "topicName": "...", "queryType": "some_value"
-            response_text = re.sub(
-                r'("topicName":\s*"[^"]*"),\s*"([^"]*)"(\s*})',
-                r'\1, "queryType": "\2"\3',
-                response_text
-            )
-        
-        # 🐛 LOG CLEANED RESPONSE
-        logger.info(f"🧹 CLEANED Response length: {len(response_text)} characters")
-        logger.info(f"🧹 CLEANED Response preview (first 500 chars): {response_text[:500]}")
-        
-        # Parse JSON - Handle both object and array formats
-        parsed_data = None
-        questions_array = None
-        
-        try:
-            # Parse the JSON
-            parsed_json = json.loads(response_text)
-            logger.info(f"✅ JSON parsing successful! Type: {type(parsed_json)}")
+            # 🐛 LOG CLEANED RESPONSE
+            logger.info(f"🧹 CLEANED Response length: {len(response_text)} characters")
+            logger.info(f"🧹 CLEANED Response preview (first 500 chars): {response_text[:500]}")
             
-            if isinstance(parsed_json, list):
-                # Direct array format: [question1, question2, ...]
-                logger.info(f"📋 Found direct array with {len(parsed_json)} questions")
-                questions_array = parsed_json
-            elif isinstance(parsed_json, dict):
-                # Object format: {"questions": [question1, question2, ...]}
-                if "questions" in parsed_json:
-                    logger.info(f"📋 Found object with questions array: {len(parsed_json['questions'])} questions")
-                    questions_array = parsed_json["questions"]
-                else:
-                    logger.error(f"❌ Object format but no 'questions' field. Available fields: {list(parsed_json.keys())}")
-                    return None
-            else:
-                logger.error(f"❌ Unexpected JSON type: {type(parsed_json)}")
-                return None
+            try:
+                questions = _stream_questions(response_text, json_type, valid_persona_ids, persona_name_to_id)
+            except ijson.JSONError as e:
+                logger.error(f"❌ JSON parsing failed: {e}")
+                logger.error(f"❌ Failed parsing this text (first 1000 chars): {response_text[:1000]}...")
+                logger.error(f"❌ Failed parsing this text (last 500 chars): {response_text[-500:]}")
                 
-        except json.JSONDecodeError as e:
-            logger.error(f"❌ JSON parsing failed: {e}")
-            logger.error(f"❌ Failed parsing this text (first 1000 chars): {response_text[:1000]}...")
-            logger.error(f"❌ Failed parsing this text (last 500 chars): {response_text[-500:]}")
-            
+                # 🔧 LAST RESORT: recover the question objects that still decode one by one,
+                # leaving partial parsing to run if none of them do
+                if _QUESTIONS_OBJECT_RE.match(response_text):
+                    questions_array = _salvage_question_objects(response_text)
+                    if questions_array:
+                        logger.info(f"📊 Salvaged {len(questions_array)} question objects from malformed response")
+                        questions = _build_questions(questions_array, valid_persona_ids, persona_name_to_id) or None
+        
+        if questions is None:
             # 🆕 ATTEMPT PARTIAL PARSING for truncated responses
             logger.info("🔧 Attempting partial parsing for truncated response...")
             questions_array = attempt_partial_parsing(response_text)
             if not questions_array:
                 return None
+            logger.info(f"📊 Found {len(questions_array)} questions in AI response")
+            questions = _build_questions(questions_array, valid_persona_ids, persona_name_to_id)
         
-        if not questions_array:
+        if not questions:
             logger.error("❌ No questions array found in parsed response")
             return None
         
-        logger.info(f"📊 Found {len(questions_array)} questions in AI response")
-        
-        questions = []
-        for i, q_data in enumerate(questions_array):
-            logger.info(f"🔍 Processing question {i+1}: {q_data}")
-            
-            # 🔧 MORE FLEXIBLE QUESTION PARSING
-            if not isinstance(q_data, dict):
-                logger.warning(f"⚠️ Skipping question {i+1} - not a dict: {q_data}")
-                continue
-                
-            if "text" not in q_data:
-                logger.warning(f"⚠️ Skipping question {i+1} without text: {q_data}")
-                continue
-            
-            # Handle missing or malformed personaId
-            persona_id = q_data.get("personaId", "")
-            if not persona_id:
-                logger.warning(f"⚠️ Question {i+1} missing personaId, using first available")
-                persona_id = list(valid_persona_ids)[0] if valid_persona_ids else str(uuid.uuid4())
-            
-            # 🔧 HANDLE BOTH PERSONA IDS AND NAMES
-            if persona_id not in valid_persona_ids:
-                # Try to map persona name to ID
-                if persona_id in persona_name_to_id:
-                    original_persona_id = persona_id
-                    persona_id = persona_name_to_id[persona_id]
-                    logger.info(f"🔄 Mapped persona name '{original_persona_id}' to ID '{persona_id}'")
-                else:
-                    logger.warning(f"⚠️ Invalid persona ID '{persona_id}', using first available")
-                    persona_id = list(valid_persona_ids)[0] if valid_persona_ids else str(uuid.uuid4())
-            
-            # Create Question object
-            question = Question(
-                id=str(uuid.uuid4()),
-                text=q_data["text"],
-                personaId=persona_id,
-                auditId="", # Will be set when storing
-                topicName=q_data.get("topicName", "General"),
-                queryType=q_data.get("queryType", "brand_analysis")
-            )
-            
-            questions.append(question)
-            logger.info(f"✅ Successfully created question {i+1} for persona {persona_id}")
-        
         logger.info(f"✅ Successfully parsed {len(questions)} questions from AI response")
         return questions
         
@@ -418,12 +516,7 @@ def attempt_partial_parsing(response_text: str) -> Optional[List[Dict]]:
         logger.info("🔧 Attempting to extract partial questions from truncated response...")
         
         # Extract individual question objects using regex
-        import re
-        
-        # Pattern to match question objects
-        question_pattern = r'\{\s*"text":\s*"([^"]+)"\s*,\s*"personaId":\s*"([^"]+)"\s*(?:,\s*"topicName":\s*"([^"]*)")?\s*(?:,\s*"queryType":\s*"([^"]*)")?\s*\}'
-        
-        matches = re.findall(question_pattern, response_text)
+        matches = _PARTIAL_QUESTION_RE.findall(response_text)
         
         if matches:
             questions = []
@@ -629,21 +722,7 @@ async def generate_questions_single(
                 "Content-Type": "application/json"
             }
 
-            payload = {
-                "model": GroqConfig.MODEL,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": f"You are an expert consumer research analyst. Generate exactly {len(personas) * 10} specific, actionable questions for brand analysis - exactly 10 questions per persona. Always respond with ONLY a valid JSON array in this format: [{{\"text\": \"question\", \"personaId\": \"exact_id\", \"topicName\": \"topic\", \"queryType\": \"brand_analysis\"}}, ...]"
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                "max_tokens": GroqConfig.MAX_TOKENS,
-                "temperature": GroqConfig.TEMPERATURE
-            }
+            payload = create_groq_payload(prompt, len(personas))
             
             logger.info(f"🌐 Making API request to GroqCloud...")
             logger.info(f"⚙️ Config: model={GroqConfig.MODEL}, max_tokens={GroqConfig.MAX_TOKENS}, temp={GroqConfig.TEMPERATURE}")
@@ -747,6 +826,79 @@ async def generate_questions_single(
     logger.error("❌ Unexpected: Reached end of function without returning")
     return False, [], "max_retries_exceeded", processing_time, 0
 
+async def stream_questions_from_groq(
+    client: httpx.AsyncClient,
+    body: QuestionGenerateRequest,
+    personas: List[Dict]
+) -> AsyncIterator[Question]:
+    """Yield each question as soon as GroqCloud finishes writing its JSON object"""
+    prompt = create_question_generation_prompt(
+        body.brandName, body.brandDescription, body.brandDomain, body.productName, body.topics, personas
+    )
+    persona_keys = tuple((persona.get('id'), persona.get('name')) for persona in personas)
+    valid_persona_ids, persona_name_to_id = _persona_maps(persona_keys)
+    # The model is asked for a bare array but sometimes wraps it in {"questions": [...]};
+    # objects that are not valid JSON get the same repairs as the buffered parser
+    parser = IncrementalQuestionParser(item_depth=None, repair=_repair_question_object)
+    
+    async with client.stream(
+        "POST", GroqConfig.BASE_URL, json=create_groq_payload(prompt, len(personas), stream=True)
+    ) as response:
+        if response.status_code != 200:
+            await response.aread()
+            logger.error(f"GroqCloud API error: {response.status_code} - {response.text}")
+            response.raise_for_status()
+        
+        async for line in response.aiter_lines():
+            if not line.startswith("data: ") or line == "data: [DONE]":
+                continue
+            content = orjson.loads(line[6:])["choices"][0]["delta"].get("content")
+            if not content:
+                continue
+            for question in _build_questions(parser.feed(content.encode()), valid_persona_ids, persona_name_to_id):
+                question.auditId = body.auditId
+                yield question
+
+def _sse_event(data: Any, event: Optional[str] = None) -> bytes:
+    """Encode one Server-Sent Event"""
+    prefix = f"event: {event}\n".encode() if event else b""
+    return prefix + b"data: " + orjson.dumps(data) + b"\n\n"
+
+async def generate_question_events(body: QuestionGenerateRequest, api_key: str) -> AsyncIterator[bytes]:
+    """Stream questions as SSE data events, followed by a done (or error) summary event"""
+    start_time = time.time()
+    if should_use_chunking(body.personas, body.topics):
+        persona_chunks = chunk_personas_for_processing(body.personas, chunk_size=3)
+    else:
+        persona_chunks = [body.personas]
+    logger.info(f"📡 Streaming questions for {len(body.personas)} personas in {len(persona_chunks)} request(s)")
+    
+    question_count = 0
+    try:
+        # Auth headers are set once on the client and reused by every chunk's request
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        async with httpx.AsyncClient(headers=headers, timeout=httpx.Timeout(GroqConfig.TIMEOUT)) as client:
+            for persona_chunk in persona_chunks:
+                async for question in stream_questions_from_groq(client, body, persona_chunk):
+                    question_count += 1
+                    yield _sse_event(question.model_dump())
+    except Exception as e:
+        logger.error(f"❌ Error while streaming questions: {e}")
+        yield _sse_event({"detail": f"AI question generation failed: {str(e)}"}, event="error")
+        return
+    
+    processing_time_ms = int((time.time() - start_time) * 1000)
+    logger.info(f"✅ Streamed {question_count} questions in {processing_time_ms}ms")
+    yield _sse_event({
+        "success": question_count > 0,
+        "source": "ai_stream",
+        "questionCount": question_count,
+        "processingTime": processing_time_ms
+    }, event="done")
+
 # API ENDPOINTS
 
 @router.post("/generate", response_model=QuestionsResponse)
@@ -819,6 +971,26 @@ async def generate_questions(request: Request, body: QuestionGenerateRequest):
             detail=f"Internal server error during question generation: {str(e)}"
         )
 
+@router.post("/generate/stream")
+# @limiter.limit(f"{settings.RATE_LIMIT_REQUESTS}/{settings.RATE_LIMIT_PERIOD}")
+async def generate_questions_stream(request: Request, body: QuestionGenerateRequest):
+    """
+    Generate questions using GroqCloud AI and stream them as Server-Sent Events
+    Each question is sent as a data event as soon as it is complete, so clients can
+    render the first questions without waiting for the whole generation. Unlike
+    /generate there are no retries, since questions already sent cannot be taken back.
+    """
+    api_key = get_groq_api_key()
+    
+    if not api_key:
+        logger.error("🔑 No GroqCloud API key available")
+        raise HTTPException(
+            status_code=503,
+            detail="AI service unavailable: API key not configured"
+        )
+    
+    return StreamingResponse(generate_question_events(body, api_key), media_type="text/event-stream")
+
 @router.post("/store", response_model=QuestionsStoreResponse)
 async def store_questions(body: QuestionsStoreRequest):
     """
@@ -23,9 +23,11 @@ import json
 import httpx
 import asyncio
 import uuid
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
+import orjson
 from fastapi import APIRouter, HTTPException, Depends, Request, Path
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field, validator
@@ -53,6 +55,9 @@ class GroqConfig:
     TEMPERATURE = settings.GROQ_TEMPERATURE
     TIMEOUT = settings.GROQ_TIMEOUT
 
+# Decodes the first JSON value embedded in a chatty response without slicing it out
+_JSON_DECODER = json.JSONDecoder()
+
 # REQUEST MODELS: Input validation with Pydantic
 class TopicsGenerateRequest(BaseModel):
     brandName: str = Field(..., min_length=1, max_length=100, description="Brand name")
@@ -284,51 +289,20 @@ def parse_topics_from_response(response_text: str) -> Optional[List[Dict[str, st
         elif cleaned_text.startswith('```'):
             cleaned_text = cleaned_text.replace('```\n', '').replace('```', '')
         
-        # Try to extract JSON from response if it's mixed with other text
-        json_start = -1
-        json_end = -1
-        
-        # Look for JSON array start
-        if '[' in cleaned_text:
+        # 🚀 FAST PATH: a clean JSON payload parses in one native call
+        try:
+            parsed_response = orjson.loads(cleaned_text)
+        except orjson.JSONDecodeError:
+            # Otherwise decode the first JSON array (or object, if there is no array) in place:
+            # raw_decode stops at the end of that value, so surrounding prose is skipped
+            # without slicing the text or matching brackets character by character
             json_start = cleaned_text.find('[')
-            # Find matching closing bracket
-            bracket_count = 0
-            for i in range(json_start, len(cleaned_text)):
-                if cleaned_text[i] == '[':
-                    bracket_count += 1
-                elif cleaned_text[i] == ']':
-                    bracket_count -= 1
-                    if bracket_count == 0:
-                        json_end = i + 1
-                        break
-        
-        # Look for JSON object start if no array found
-        elif '{' in cleaned_text:
-            json_start = cleaned_text.find('{')
-            # Find matching closing brace
-            brace_count = 0
-            for i in range(json_start, len(cleaned_text)):
-                if cleaned_text[i] == '{':
-                    brace_count += 1
-                elif cleaned_text[i] == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        json_end = i + 1
-                        break
-        
-        # Extract just the JSON part if found
-        if json_start >= 0 and json_end > json_start:
-            cleaned_text = cleaned_text[json_start:json_end].strip()
-            logger.info(f"🔧 Extracted JSON: {cleaned_text[:200]}")
-        
-        # Remove any leading/trailing whitespace after cleaning
-        cleaned_text = cleaned_text.strip()
-        
-        # Log cleaned text
-        logger.info(f"🧹 Cleaned response (first 200 chars): {cleaned_text[:200]}")
-        
-        # Parse JSON
-        parsed_response = json.loads(cleaned_text)
+            if json_start == -1:
+                json_start = cleaned_text.find('{')
+            if json_start == -1:
+                raise
+            logger.info(f"🔧 Extracting JSON from position {json_start}: {cleaned_text[json_start:json_start + 200]}")
+            parsed_response, _ = _JSON_DECODER.raw_decode(cleaned_text, json_start)
         
         # Handle both formats: {"topics": [...]} and [...]
         if isinstance(parsed_response, dict):
@@ -512,9 +486,7 @@ async def generate_topics(request: Request, body: TopicsGenerateRequest):
                 ))
             
             # Validate category distribution
-            category_counts = {}
-            for topic in topics:
-                category_counts[topic.category] = category_counts.get(topic.category, 0) + 1
+            category_counts = Counter(topic.category for topic in topics)
             
             expected_distribution = {"unbranded": 4, "branded": 3, "comparative": 3}
             if category_counts != expected_distribution:
@@ -0,0 +1,106 @@
+"""
+Incremental parser for streamed question payloads
+
+Scans JSON bytes as they arrive and emits each question object as soon as its
+closing brace is seen, so consumers never re-parse the accumulated prefix.
+"""
+import logging
+from typing import Callable, Dict, List, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+_OPEN = frozenset(b'{[')
+_CLOSE = frozenset(b'}]')
+_QUOTE = ord('"')
+_BACKSLASH = ord('\\')
+_OPEN_BRACE = ord('{')
+_OPEN_BRACKET = ord('[')
+
+
+class IncrementalQuestionParser:
+    """Emit completed question objects from a JSON byte stream
+
+    item_depth is the number of containers enclosing each question object:
+    2 for {"questions": [{...}, ...]} and 1 for a bare [{...}, ...] array.
+    None picks between the two from the first container opened in the stream.
+
+    Everything before the first { or [ is skipped unscanned, quotes included, the same
+    way the buffered parser strips chatty prefixes and code fences. A prefix such as
+    'Here are "your" questions: [...' is fine, but a bracket inside that prose would
+    still be taken as the start of the payload.
+
+    repair, when given, gets the raw bytes of each object that is not valid JSON and
+    returns the recovered question dict, or None to drop the object.
+    """
+
+    def __init__(
+        self,
+        item_depth: Optional[int] = 2,
+        repair: Optional[Callable[[bytes], Optional[Dict]]] = None
+    ):
+        self.item_depth = item_depth
+        self.repair = repair
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.buffer = bytearray()
+        self.emitted = 0
+        self._capturing = False
+        self._started = False
+
+    def feed(self, chunk: bytes) -> List[Dict]:
+        """Scan only the new bytes and return any question objects they complete"""
+        completed = []
+        start: Optional[int] = 0 if self._capturing else None
+
+        for i, byte in enumerate(chunk):
+            if not self._started:
+                if byte not in _OPEN:
+                    continue
+                self._started = True
+                if self.item_depth is None:
+                    self.item_depth = 1 if byte == _OPEN_BRACKET else 2
+
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif byte == _BACKSLASH:
+                    self.escape = True
+                elif byte == _QUOTE:
+                    self.in_string = False
+                continue
+
+            if byte == _QUOTE:
+                self.in_string = True
+            elif byte in _OPEN:
+                if byte == _OPEN_BRACE and self.depth == self.item_depth and not self._capturing:
+                    self._capturing = True
+                    start = i
+                self.depth += 1
+            elif byte in _CLOSE:
+                self.depth -= 1
+                if self._capturing and self.depth == self.item_depth:
+                    self.buffer += chunk[start:i + 1]
+                    completed.append(self._emit())
+                    start = None
+
+        if self._capturing and start is not None:
+            self.buffer += chunk[start:]
+
+        return [question for question in completed if question is not None]
+
+    def _emit(self) -> Optional[Dict]:
+        """Decode the buffered question object and reset capture state"""
+        self._capturing = False
+        try:
+            question = orjson.loads(self.buffer)
+        except orjson.JSONDecodeError as e:
+            question = self.repair(bytes(self.buffer)) if self.repair else None
+            if question is None:
+                logger.warning(f"⚠️ Skipping malformed streamed question: {e}")
+        if question is not None:
+            self.emitted += 1
+        self.buffer.clear()
+        return question
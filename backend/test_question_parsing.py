@@ -0,0 +1,76 @@
+"""
+Regression checks for parsing malformed GroqCloud question payloads
+Usage: python backend/test_question_parsing.py
+"""
+
+import os
+import sys
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(__file__))
+# The routes module reads its settings at import time; no request is ever sent here
+os.environ.setdefault("GROQ_API_KEY", "test-key")
+
+from app.routes.questions import parse_questions_from_response, _repair_question_object
+from app.services.question_stream import IncrementalQuestionParser
+
+PERSONAS = [{"id": "p1", "name": "Daily Commuter"}, {"id": "p2", "name": "Family"}]
+
+def _parsed(response_text: str):
+    questions = parse_questions_from_response(response_text, PERSONAS)
+    return None if questions is None else [(q.text, q.personaId, q.topicName, q.queryType) for q in questions]
+
+def test_braces_in_text_with_missing_field_names() -> None:
+    """Braces inside question text must not cut the object short during repair"""
+    response_text = (
+        '{"questions":[{"text": "Is {Brand} good?", "Daily Commuter", "topicName": "T", "comparison"}, '
+        '{"text": "b", "personaId": "p2", "topicName": "T", "queryType": "q"}]}'
+    )
+    assert _parsed(response_text) == [
+        ("Is {Brand} good?", "p1", "T", "comparison"),
+        ("b", "p2", "T", "q"),
+    ]
+
+def test_salvage_keeps_braces_in_text() -> None:
+    """Per-object salvage splits objects on real braces only, never ones inside strings"""
+    response_text = (
+        '{"questions":[{"text": "Is {Brand} [really] good?", "personaId": "p1", "topicName": "T", "queryType": "q"}, '
+        '{"text": "b" "personaId": "p2"}, {"text": "c", "Family", "topicName": "T", "x"} {"foo": 1}]}'
+    )
+    assert _parsed(response_text) == [
+        ("Is {Brand} [really] good?", "p1", "T", "q"),
+        ("b", "p2", "General", "brand_analysis"),
+        ("c", "p2", "T", "x"),
+    ]
+
+def test_salvage_rejects_objects_without_text() -> None:
+    """Bare values and non-string text never become questions"""
+    assert _parsed('{"questions":[{"a", "b"}, {"text": 5, "personaId": "p1"} {"x"}]}') is None
+    assert _parsed('{"data":[{"text":"a" "personaId":"p1"}]}') is None
+
+def test_stream_skips_prose_and_repairs_objects() -> None:
+    """Streamed payloads: quoted prose before the array is skipped, malformed objects are repaired"""
+    response_text = (
+        'Here are "your" questions:\n[{"text": "Is {Brand} good?", "Daily Commuter", "topicName": "T", "comparison"}, '
+        '{"text": "b", "personaId": "p2", "topicName": "T", "queryType": "q"}, {"a", "b"}]'
+    ).encode()
+    parser = IncrementalQuestionParser(item_depth=None, repair=_repair_question_object)
+    # Feed a few bytes at a time, as GroqCloud deltas arrive
+    questions = [question for offset in range(0, len(response_text), 7) for question in parser.feed(response_text[offset:offset + 7])]
+    assert questions == [
+        {"text": "Is {Brand} good?", "personaId": "Daily Commuter", "topicName": "T", "queryType": "comparison"},
+        {"text": "b", "personaId": "p2", "topicName": "T", "queryType": "q"},
+    ]
+
+def main() -> None:
+    for check in (
+        test_braces_in_text_with_missing_field_names,
+        test_salvage_keeps_braces_in_text,
+        test_salvage_rejects_objects_without_text,
+        test_stream_skips_prose_and_repairs_objects,
+    ):
+        check()
+        print(f"✅ {check.__name__}")
+
+if __name__ == "__main__":
+    main()